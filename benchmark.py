@@ -0,0 +1,233 @@
+import argparse
+import cProfile
+import io
+import json
+import platform
+import pstats
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from binary_tree_visualization import build_heap_tree
+from dijkstra import dijkstra
+from greedy import dynamic_programming, greedy_algorithm
+from linked_list import create_linked_list, merge_sort
+from monte_carlo import simulate_dice_rolls
+
+# =============================================================================
+# Генератори синтетичних вхідних даних
+# =============================================================================
+def random_graph(num_vertices, edges_per_vertex, max_weight=100, seed=None):
+    """
+    Генерує випадковий зв'язний неорієнтований зважений граф у форматі dijkstra.dijkstra.
+
+    :param num_vertices: Кількість вершин.
+    :param edges_per_vertex: Середня кількість додаткових ребер на вершину.
+    :param max_weight: Максимальна вага ребра.
+    :param seed: Зерно генератора випадкових чисел.
+    :return: Словник {вершина: [(сусід, вага), ...]}.
+    """
+    rng = random.Random(seed)
+    graph = {vertex: [] for vertex in range(num_vertices)}
+
+    def add_edge(u, v):
+        weight = rng.randint(1, max_weight)
+        graph[u].append((v, weight))
+        graph[v].append((u, weight))
+
+    # Остов-ланцюжок гарантує зв'язність графа
+    for vertex in range(1, num_vertices):
+        add_edge(rng.randrange(vertex), vertex)
+    for _ in range(num_vertices * edges_per_vertex):
+        u, v = rng.randrange(num_vertices), rng.randrange(num_vertices)
+        if u != v:
+            add_edge(u, v)
+    return graph
+
+def grid_graph(rows, cols, max_weight=100, seed=None):
+    """
+    Генерує граф-решітку rows x cols з випадковими вагами ребер між сусідніми клітинками.
+    Вершини — кортежі (рядок, стовпець).
+    """
+    rng = random.Random(seed)
+    graph = {(r, c): [] for r in range(rows) for c in range(cols)}
+    for r in range(rows):
+        for c in range(cols):
+            for neighbor in ((r + 1, c), (r, c + 1)):
+                if neighbor in graph:
+                    weight = rng.randint(1, max_weight)
+                    graph[(r, c)].append((neighbor, weight))
+                    graph[neighbor].append(((r, c), weight))
+    return graph
+
+def random_menu(num_items, max_cost=100, max_calories=1000, seed=None):
+    """
+    Генерує меню з num_items страв у форматі greedy.greedy_algorithm.
+    """
+    rng = random.Random(seed)
+    return {
+        f"dish-{i}": {"cost": rng.randint(1, max_cost), "calories": rng.randint(1, max_calories)}
+        for i in range(num_items)
+    }
+
+def random_list(size, seed=None):
+    """
+    Генерує список з size випадкових цілих чисел.
+    """
+    rng = random.Random(seed)
+    return [rng.randrange(size * 10 + 1) for _ in range(size)]
+
+# =============================================================================
+# Вимірювання
+# =============================================================================
+def measure(setup, func, repeat=3, profile=False, profile_limit=20):
+    """
+    Вимірює час виконання та пікову пам'ять функції.
+    setup() викликається перед кожним запуском і не входить у вимірювання;
+    її результат (кортеж аргументів) передається у func.
+
+    :param repeat: Кількість запусків для вимірювання часу (береться мінімум).
+    :param profile: Якщо True, додатково збирається профіль cProfile.
+    :param profile_limit: Кількість рядків профілю у звіті.
+    :return: Словник з wall_time, wall_times, peak_memory та profile.
+    """
+    if repeat < 1:
+        raise ValueError("repeat має бути не менше 1")
+
+    # Час міряємо без tracemalloc, бо він суттєво сповільнює виконання
+    wall_times = []
+    for _ in range(repeat):
+        args = setup()
+        start = time.perf_counter()
+        func(*args)
+        wall_times.append(time.perf_counter() - start)
+
+    # Окремий запуск для пікової пам'яті
+    args = setup()
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    profile_text = None
+    if profile:
+        args = setup()
+        profiler = cProfile.Profile()
+        profiler.runcall(func, *args)
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(profile_limit)
+        profile_text = stream.getvalue()
+
+    return {
+        "wall_time": min(wall_times),
+        "wall_times": wall_times,
+        "peak_memory": peak_memory,
+        "profile": profile_text,
+    }
+
+def _lazy(factory):
+    """
+    Повертає функцію, яка створює вхідні дані під час першого виклику й далі віддає ті самі.
+    Так дані генеруються лише для сценаріїв, які справді запускаються.
+    """
+    cache = []
+
+    def get():
+        if not cache:
+            cache.append(factory())
+        return cache[0]
+    return get
+
+def build_cases(scale=1.0, seed=0):
+    """
+    Формує перелік сценаріїв: (назва, параметри, setup, func).
+    scale пропорційно збільшує розміри вхідних даних; самі дані генеруються
+    ліниво під час першого виклику setup.
+    """
+    def scaled(value):
+        return max(1, int(value * scale))
+
+    cases = []
+
+    for n in (scaled(1_000), scaled(10_000)):
+        graph = _lazy(lambda n=n: random_graph(n, 4, seed=seed))
+        cases.append(("dijkstra/random", {"vertices": n, "edges_per_vertex": 4},
+                      lambda graph=graph: (graph(), 0), dijkstra))
+    for side in (scaled(30), scaled(100)):
+        graph = _lazy(lambda side=side: grid_graph(side, side, seed=seed))
+        cases.append(("dijkstra/grid", {"rows": side, "cols": side},
+                      lambda graph=graph: (graph(), (0, 0)), dijkstra))
+
+    for n, budget in ((scaled(100), scaled(1_000)), (scaled(200), scaled(5_000))):
+        items = _lazy(lambda n=n: random_menu(n, seed=seed))
+        for name, func in (("greedy/greedy_algorithm", greedy_algorithm),
+                           ("greedy/dynamic_programming", dynamic_programming)):
+            cases.append((name, {"items": n, "budget": budget},
+                          lambda items=items, budget=budget: (items(), budget), func))
+
+    for n in (scaled(10_000), scaled(100_000)):
+        values = _lazy(lambda n=n: random_list(n, seed=seed))
+        for mode in ("top_down", "bottom_up", "natural"):
+            cases.append((f"linked_list/merge_sort[{mode}]", {"size": n},
+                          lambda values=values: (create_linked_list(values()),),
+                          lambda head, mode=mode: merge_sort(head, mode=mode)))
+
+    for trials in (scaled(100_000), scaled(1_000_000)):
+        cases.append(("monte_carlo/simulate_dice_rolls", {"trials": trials},
+                      lambda trials=trials: (trials,), simulate_dice_rolls))
+
+    for n in (scaled(10_000), scaled(100_000)):
+        values = _lazy(lambda n=n: random_list(n, seed=seed))
+        cases.append(("binary_tree_visualization/build_heap_tree", {"size": n},
+                      lambda values=values: (values(),), build_heap_tree))
+
+    return cases
+
+def run_benchmarks(scale=1.0, repeat=3, profile=False, only=None, seed=0):
+    """
+    Запускає всі сценарії (або лише ті, назва яких містить only) та повертає звіт.
+    """
+    results = []
+    for name, params, setup, func in build_cases(scale, seed):
+        if only and only not in name:
+            continue
+        # Фіксуємо зерно, щоб випадкові алгоритми були відтворюваними між запусками
+        random.seed(seed)
+        result = measure(setup, func, repeat=repeat, profile=profile)
+        results.append({"name": name, "params": params, **result})
+        print(f"{name:<45} {json.dumps(params):<45} "
+              f"{result['wall_time'] * 1000:>10.2f} мс {result['peak_memory'] / 1024:>10.1f} КБ")
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "scale": scale,
+        "repeat": repeat,
+        "seed": seed,
+        "results": results,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк алгоритмів репозиторію")
+    parser.add_argument("--scale", type=float, default=1.0, help="множник розмірів вхідних даних")
+    parser.add_argument("--repeat", type=int, default=3, help="кількість запусків для вимірювання часу")
+    parser.add_argument("--profile", action="store_true", help="зібрати профіль cProfile для кожного сценарію")
+    parser.add_argument("--only", help="запускати лише сценарії, назва яких містить цей рядок")
+    parser.add_argument("--seed", type=int, default=0, help="зерно генератора вхідних даних")
+    parser.add_argument("--output", default="bench_output.json", help="шлях до JSON-звіту")
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat має бути не менше 1")
+
+    report = run_benchmarks(args.scale, args.repeat, args.profile, args.only, args.seed)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\nЗвіт збережено у {args.output}")
+
+if __name__ == '__main__':
+    main()
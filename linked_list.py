@@ -1,3 +1,8 @@
+import heapq
+import os
+import pickle
+import tempfile
+
 class Node:
     """
     Клас для вузла однозв’язного списку.
@@ -30,35 +35,67 @@ def reverse_list(head):
         current = next_node
     return prev  # нова голова списку
 
-def merge_two_sorted_lists(l1, l2):
+def merge_two_sorted_lists(l1, l2, key=None):
     """
     Функція для об'єднання двох відсортованих однозв’язних списків в один відсортований список.
+    Злиття стабільне: при рівних ключах першим іде вузол зі списку l1.
+
+    :param key: Необов'язкова функція, що обчислює ключ порівняння для data вузла.
     """
+    if l1 is None:
+        return l2
+    if l2 is None:
+        return l1
+
     dummy = Node(0)  # допоміжний вузол для спрощення злиття
     tail = dummy
 
-    # Поки обидва списки не спустошено, вибираємо вузол з меншим значенням
-    while l1 and l2:
-        if l1.data < l2.data:
-            tail.next = l1
-            l1 = l1.next
-        else:
+    # Ключі поточних голів обчислюються лише тоді, коли відповідна голова зсувається
+    k1 = l1.data if key is None else key(l1.data)
+    k2 = l2.data if key is None else key(l2.data)
+
+    # Поки обидва списки не спустошено, вибираємо вузол з меншим ключем;
+    # вузол з l2 береться лише тоді, коли він строго менший (стабільність)
+    while True:
+        if k2 < k1:
             tail.next = l2
+            tail = l2
             l2 = l2.next
-        tail = tail.next
+            if l2 is None:
+                break
+            k2 = l2.data if key is None else key(l2.data)
+        else:
+            tail.next = l1
+            tail = l1
+            l1 = l1.next
+            if l1 is None:
+                break
+            k1 = l1.data if key is None else key(l1.data)
 
-    # Додаємо залишок одного з списків (якщо є)
-    if l1:
-        tail.next = l1
-    elif l2:
-        tail.next = l2
+    # Додаємо залишок одного з списків
+    tail.next = l1 if l1 else l2
 
     return dummy.next  # повертаємо об'єднаний список, пропускаючи dummy-вузол
 
-def merge_sort(head):
+def merge_sort(head, key=None, mode="top_down"):
     """
     Функція для сортування однозв’язного списку алгоритмом злиття.
+    Сортування стабільне: вузли з рівними ключами зберігають початковий порядок.
+
+    :param head: Голова списку.
+    :param key: Необов'язкова функція, що обчислює ключ порівняння для data вузла.
+    :param mode: "top_down" — рекурсивне сортування з пошуком середини,
+                 "bottom_up" — ітеративне злиття серій ширини 1, 2, 4, ...,
+                 "natural" — ітеративне злиття вже відсортованих серій.
+    :return: Голова відсортованого списку.
     """
+    if mode == "bottom_up":
+        return merge_sort_bottom_up(head, key)
+    if mode == "natural":
+        return natural_merge_sort(head, key)
+    if mode != "top_down":
+        raise ValueError(f"Невідомий режим сортування: {mode}")
+
     # Базовий випадок: список порожній або містить один елемент
     if head is None or head.next is None:
         return head
@@ -75,11 +112,204 @@ def merge_sort(head):
     slow.next = None  # перериваємо зв'язок, утворюючи два окремих списки
 
     # Рекурсивно сортуємо обидві половини
-    left = merge_sort(head)
-    right = merge_sort(mid)
+    left = merge_sort(head, key)
+    right = merge_sort(mid, key)
 
     # Об'єднуємо два відсортованих списки
-    return merge_two_sorted_lists(left, right)
+    return merge_two_sorted_lists(left, right, key)
+
+def _push_run(slots, run, key=None):
+    """
+    Додає відсортовану серію до "двійкового лічильника" серій.
+    slots[i] містить злиття 2**i послідовних серій або None; серія у старшому слоті
+    завжди складається з раніших вузлів, тож злиття (slots[i], run) зберігає стабільність.
+    """
+    i = 0
+    while i < len(slots) and slots[i] is not None:
+        run = merge_two_sorted_lists(slots[i], run, key)
+        slots[i] = None
+        i += 1
+    if i == len(slots):
+        slots.append(run)
+    else:
+        slots[i] = run
+
+def _collapse_runs(slots, key=None):
+    """
+    Зливає всі серії лічильника в один список, від молодших слотів до старших.
+    """
+    result = None
+    for run in slots:
+        if run is not None:
+            result = merge_two_sorted_lists(run, result, key)
+    return result
+
+def merge_sort_bottom_up(head, key=None):
+    """
+    Ітеративне сортування злиттям "знизу вгору" без рекурсії.
+    Вузли по одному відрізаються від списку й зливаються в серії ширини 1, 2, 4, ...
+    (двійковий лічильник з O(log n) слотів), тож список не доводиться ні ділити
+    навпіл, ні повторно проходити для пошуку меж серій.
+    """
+    slots = []
+    while head:
+        node = head
+        head = head.next
+        node.next = None
+        _push_run(slots, node, key)
+    return _collapse_runs(slots, key)
+
+def _cut_run(head, key=None):
+    """
+    Відрізає від списку найдовшу неспадну серію, що починається з head.
+    Повертає голову залишку.
+    """
+    current = head
+    current_key = current.data if key is None else key(current.data)
+    while current.next:
+        next_key = current.next.data if key is None else key(current.next.data)
+        if next_key < current_key:
+            break
+        current = current.next
+        current_key = next_key
+    rest = current.next
+    current.next = None
+    return rest
+
+def natural_merge_sort(head, key=None):
+    """
+    Природне сортування злиттям: список один раз розбивається на вже відсортовані
+    серії, які зливаються через той самий двійковий лічильник, що й у merge_sort_bottom_up.
+    Для r серій працює за O(n log r), тобто для майже відсортованого списку — майже за O(n).
+    """
+    slots = []
+    while head:
+        run = head
+        head = _cut_run(run, key)
+        _push_run(slots, run, key)
+    return _collapse_runs(slots, key)
+
+def merge_k_sorted_lists(lists, key=None):
+    """
+    K-шляхове злиття відсортованих однозв’язних списків за O(n log k).
+    Купа зберігає лише поточні голови списків, вузли перечіплюються на місці.
+    Злиття стабільне: при рівних ключах першим іде вузол зі списку з меншим індексом.
+
+    :param lists: Ітерований набір голів відсортованих списків (None допускається).
+    :param key: Необов'язкова функція, що обчислює ключ порівняння для data вузла.
+    :return: Голова об'єднаного відсортованого списку.
+    """
+    # Елемент купи: (ключ, індекс списку, вузол); індекс розв'язує нічиї та забезпечує стабільність
+    heap = []
+    for index, node in enumerate(lists):
+        if node is not None:
+            heap.append((node.data if key is None else key(node.data), index, node))
+    heapq.heapify(heap)
+
+    dummy = Node(0)
+    tail = dummy
+    while heap:
+        _, index, node = heap[0]
+        tail.next = node
+        tail = node
+        node = node.next
+        if node is not None:
+            # Замінюємо вершину купи наступним вузлом того ж списку
+            heapq.heapreplace(heap, (node.data if key is None else key(node.data), index, node))
+        else:
+            heapq.heappop(heap)
+    tail.next = None
+
+    return dummy.next
+
+def _spill_run(run, directory):
+    """
+    Записує відсортовану серію (будь-який ітерований потік) у новий файл у directory.
+    Файл одразу закривається, тож відкритих дескрипторів не накопичується.
+    Повертає шлях до файлу.
+    """
+    fd, path = tempfile.mkstemp(dir=directory)
+    with os.fdopen(fd, "wb") as spill:
+        for value in run:
+            pickle.dump(value, spill, pickle.HIGHEST_PROTOCOL)
+    return path
+
+def _read_run(path):
+    """
+    Потоково читає значення серії з файлу; файл відкритий лише під час читання.
+    """
+    with open(path, "rb") as spill:
+        while True:
+            try:
+                yield pickle.load(spill)
+            except EOFError:
+                return
+
+def _merge_spills(paths, key=None):
+    """
+    Потоково зливає серії з файлів paths; heapq.merge тримає в купі лише
+    поточну голову кожної серії: O(n log k). Порядок paths задає стабільність.
+    """
+    return heapq.merge(*(_read_run(path) for path in paths), key=key)
+
+def external_sort_iter(values, run_size=100_000, key=None, max_open_runs=64):
+    """
+    Зовнішнє сортування: даних може бути більше, ніж вміщується в пам'ять.
+    Вхідний потік ділиться на серії по run_size елементів, кожна серія сортується
+    в пам'яті та скидається у тимчасовий файл, після чого серії потоково
+    зливаються k-шляховим злиттям. Якщо серій більше за max_open_runs, вони
+    спершу зливаються проміжними проходами групами по max_open_runs, тож
+    одночасно відкрито не більше max_open_runs файлів. Сортування стабільне.
+
+    :param values: Будь-який ітерований потік значень.
+    :param run_size: Максимальна кількість елементів однієї серії в пам'яті.
+    :param key: Необов'язкова функція, що обчислює ключ порівняння.
+    :param max_open_runs: Максимальна кількість серій в одному злитті (не менше 2).
+    :return: Генератор значень у відсортованому порядку.
+    """
+    # Перевіряємо аргументи одразу під час виклику, а не на першому next()
+    if run_size < 1:
+        raise ValueError("run_size має бути додатним цілим числом")
+    if max_open_runs < 2:
+        raise ValueError("max_open_runs має бути не менше 2")
+    return _external_sort(values, run_size, key, max_open_runs)
+
+def _external_sort(values, run_size, key, max_open_runs):
+    """
+    Генератор, що виконує external_sort_iter; тимчасові файли видаляються разом з каталогом.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        run = []
+        for value in values:
+            run.append(value)
+            if len(run) >= run_size:
+                run.sort(key=key)
+                paths.append(_spill_run(run, directory))
+                run = []
+        if run:
+            run.sort(key=key)
+            paths.append(_spill_run(run, directory))
+        del run
+
+        # Проміжні проходи: сусідні групи серій зливаються в одну, зберігаючи порядок
+        while len(paths) > max_open_runs:
+            merged_paths = []
+            for start in range(0, len(paths), max_open_runs):
+                group = paths[start:start + max_open_runs]
+                merged_paths.append(_spill_run(_merge_spills(group, key), directory))
+                for path in group:
+                    os.remove(path)
+            paths = merged_paths
+
+        yield from _merge_spills(paths, key)
+
+def external_sort(values, run_size=100_000, key=None, max_open_runs=64):
+    """
+    Зовнішнє сортування потоку значень у однозв’язний список.
+    Див. external_sort_iter.
+    """
+    return create_linked_list(external_sort_iter(values, run_size, key, max_open_runs))
 
 def create_linked_list(arr):
     """
@@ -115,6 +345,12 @@ if __name__ == '__main__':
     print("Відсортований список:")
     print_list(sorted_head)
 
+    # Ітеративні режими сортування: "знизу вгору" та природне злиття
+    print("Сортування знизу вгору:")
+    print_list(merge_sort(create_linked_list([4, 2, 5, 1, 3]), mode="bottom_up"))
+    print("Природне сортування злиттям (за спаданням через key):")
+    print_list(merge_sort(create_linked_list([1, 2, 3, 5, 4]), key=lambda x: -x, mode="natural"))
+
     # Створення двох відсортованих списків для демонстрації злиття
     list1 = create_linked_list([1, 3, 5, 7])
     list2 = create_linked_list([2, 4, 6, 8])
@@ -126,4 +362,13 @@ if __name__ == '__main__':
     # Об'єднання двох відсортованих списків в один відсортований список
     merged_head = merge_two_sorted_lists(list1, list2)
     print("Об'єднаний відсортований список:")
-    print_list(merged_head)
\ No newline at end of file
+    print_list(merged_head)
+
+    # K-шляхове злиття кількох відсортованих списків
+    shards = [create_linked_list([1, 4, 7]), create_linked_list([2, 5, 8]), create_linked_list([0, 3, 6, 9])]
+    print("K-шляхове злиття:")
+    print_list(merge_k_sorted_lists(shards))
+
+    # Зовнішнє сортування з маленькими серіями, що скидаються на диск
+    print("Зовнішнє сортування:")
+    print_list(external_sort([9, 3, 7, 1, 8, 2, 6, 4, 5, 0], run_size=3))
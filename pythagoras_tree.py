@@ -1,5 +1,12 @@
-import turtle
+import argparse
 import math
+import turtle
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.image import imsave
 
 def pythagoras_tree(t, size, level, branch_angle):
     """
@@ -54,7 +61,239 @@ def pythagoras_tree(t, size, level, branch_angle):
     t.pendown()
     pythagoras_tree(t, right_size, level - 1, branch_angle)
 
+def _square_corners(xy, theta, size):
+    """
+    Обчислює чотири кути квадратів одного рівня.
+
+    :param xy: масив (m, 2) нижніх лівих кутів (початкових позицій turtle)
+    :param theta: масив (m,) напрямків "вперед" у радіанах
+    :param size: масив (m,) довжин сторін
+    :return: масив (m, 4, 2) кутів у порядку обходу turtle (проти годинникової стрілки)
+    """
+    forward = np.stack((np.cos(theta), np.sin(theta)), axis=1) * size[:, None]
+    left = np.stack((-np.sin(theta), np.cos(theta)), axis=1) * size[:, None]
+    return np.stack((xy, xy + forward, xy + forward + left, xy + left), axis=1)
+
+def _next_level(corners, theta, size, branch_angle):
+    """
+    Обчислює початкові позиції, напрямки та розміри квадратів-гілок наступного рівня.
+    Спершу йдуть усі ліві гілки, потім усі праві.
+    """
+    angle = math.radians(branch_angle)
+    # Ліва гілка стартує з верхнього лівого кута, права — з верхнього правого
+    xy = np.concatenate((corners[:, 3], corners[:, 2]))
+    theta = np.concatenate((theta + angle, theta - (math.pi / 2 - angle)))
+    size = np.concatenate((size * math.cos(angle), size * math.sin(angle)))
+    return xy, theta, size
+
+def pythagoras_tree_geometry(size, level, branch_angle, origin=(0.0, 0.0), heading=0.0, min_size=0.0):
+    """
+    Ітеративно (без рекурсії та turtle) обчислює геометрію дерева Піфагора.
+    Усі квадрати одного рівня обчислюються разом як масиви NumPy.
+
+    :param size: довжина сторони початкового квадрата
+    :param level: рівень рекурсії (кількість рівнів квадратів)
+    :param branch_angle: кут повороту для лівої гілки (в градусах)
+    :param origin: нижній лівий кут початкового квадрата
+    :param heading: початковий напрямок "вперед" (в градусах)
+    :param min_size: рівень деталізації — квадрати зі стороною меншою за min_size
+                     відкидаються разом з усіма своїми гілками
+    :return: масив (n, 4, 2) кутів квадратів, рівень за рівнем
+             (без відсікання n = 2**level - 1)
+    """
+    xy = np.array([origin], dtype=float)
+    theta = np.array([math.radians(heading)])
+    sizes = np.array([size], dtype=float)
+
+    levels = []
+    for _ in range(level):
+        if min_size > 0:
+            keep = sizes >= min_size
+            xy, theta, sizes = xy[keep], theta[keep], sizes[keep]
+        if not len(sizes):
+            break
+        corners = _square_corners(xy, theta, sizes)
+        levels.append(corners)
+        xy, theta, sizes = _next_level(corners, theta, sizes, branch_angle)
+
+    if not levels:
+        return np.empty((0, 4, 2))
+    return np.concatenate(levels)
+
+def iter_pythagoras_tree(size, level, branch_angle, origin=(0.0, 0.0), heading=0.0,
+                         min_size=0.0, chunk_size=65536):
+    """
+    Потоково генерує квадрати дерева Піфагора порціями фіксованого розміру.
+    Обхід іде в глибину пакетами не більше chunk_size гілок, тож пам'ять
+    обмежена O(level * chunk_size) незалежно від глибини дерева.
+
+    :param min_size: рівень деталізації (див. pythagoras_tree_geometry)
+    :param chunk_size: кількість квадратів у кожній порції (остання може бути меншою)
+    :return: генератор масивів (m, 4, 2) кутів квадратів, m <= chunk_size
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size має бути додатним цілим числом")
+
+    # Стек пакетів гілок: (позиції, напрямки, розміри, кількість рівнів, що залишились)
+    stack = [(np.array([origin], dtype=float), np.array([math.radians(heading)]),
+              np.array([size], dtype=float), level)]
+    pending = []  # обчислені квадрати, що ще не склали повну порцію
+    pending_count = 0
+
+    while stack:
+        xy, theta, sizes, remaining = stack.pop()
+        if remaining <= 0:
+            continue
+        if min_size > 0:
+            keep = sizes >= min_size
+            xy, theta, sizes = xy[keep], theta[keep], sizes[keep]
+        if not len(sizes):
+            continue
+
+        corners = _square_corners(xy, theta, sizes)
+        pending.append(corners)
+        pending_count += len(corners)
+
+        if remaining > 1:
+            xy, theta, sizes = _next_level(corners, theta, sizes, branch_angle)
+            # Ділимо гілки на пакети, щоб жоден пакет не перевищував chunk_size
+            for start in range(len(sizes) - chunk_size, -chunk_size, -chunk_size):
+                batch = slice(max(start, 0), start + chunk_size)
+                stack.append((xy[batch], theta[batch], sizes[batch], remaining - 1))
+
+        # Віддаємо повні порції, як тільки їх набралося достатньо
+        if pending_count >= chunk_size:
+            buffered = np.concatenate(pending)
+            full = len(buffered) - len(buffered) % chunk_size
+            for start in range(0, full, chunk_size):
+                yield buffered[start:start + chunk_size]
+            pending = [buffered[full:]] if full < len(buffered) else []
+            pending_count = len(buffered) - full
+
+    if pending_count:
+        yield np.concatenate(pending)
+
+def tree_extent(size, level, branch_angle, origin=(0.0, 0.0), heading=0.0,
+                min_size=0.0, chunk_size=65536, margin=0.01):
+    """
+    Обчислює точні межі (xmin, xmax, ymin, ymax) квадратів, які згенерує
+    iter_pythagoras_tree з тими самими параметрами. Геометрія проходиться потоково
+    без малювання, тож пам'ять обмежена так само, як і в iter_pythagoras_tree.
+    Запас margin (частка розміру) лише залишає місце для товщини ліній.
+    """
+    xmin = ymin = math.inf
+    xmax = ymax = -math.inf
+    for chunk in iter_pythagoras_tree(size, level, branch_angle, origin, heading, min_size, chunk_size):
+        points = chunk.reshape(-1, 2)
+        chunk_min = points.min(axis=0)
+        chunk_max = points.max(axis=0)
+        xmin, ymin = min(xmin, chunk_min[0]), min(ymin, chunk_min[1])
+        xmax, ymax = max(xmax, chunk_max[0]), max(ymax, chunk_max[1])
+    if xmin > xmax:
+        return (origin[0] - size, origin[0] + size, origin[1] - size, origin[1] + size)
+    pad = margin * max(xmax - xmin, ymax - ymin)
+    return (xmin - pad, xmax + pad, ymin - pad, ymax + pad)
+
+def pixel_size(extent, dpi=100, figsize=(8, 6)):
+    """
+    Повертає довжину одного пікселя у світових координатах для зображення,
+    у яке extent вписано зі збереженням пропорцій.
+    """
+    xmin, xmax, ymin, ymax = extent
+    return max((xmax - xmin) / (figsize[0] * dpi), (ymax - ymin) / (figsize[1] * dpi))
+
+def render_tree(squares, filename, color="forestgreen", dpi=100, figsize=(8, 6)):
+    """
+    Малює всі квадрати одним пакетом (PolyCollection) та зберігає зображення у файл.
+    Формат (PNG, SVG, ...) визначається розширенням filename; екран не потрібен.
+
+    :param squares: масив (n, 4, 2) кутів квадратів
+    :param filename: шлях до вихідного файлу
+    """
+    fig = Figure(figsize=figsize, dpi=dpi)
+    ax = fig.add_subplot()
+    ax.add_collection(PolyCollection(squares, facecolors="none", edgecolors=color, linewidths=0.5))
+    ax.set_aspect("equal")
+    ax.autoscale_view()
+    ax.axis("off")
+    fig.savefig(filename)
+
+def render_tree_stream(chunks, filename, extent, color="forestgreen", dpi=100, figsize=(8, 6)):
+    """
+    Поступово растеризує порції квадратів у PNG-файл.
+    Кожна порція малюється на полотно Agg і одразу звільняється, тож у пам'яті
+    перебуває лише одна порція. Межі extent мають бути відомі заздалегідь.
+
+    :param chunks: ітерований набір масивів (m, 4, 2), наприклад iter_pythagoras_tree
+    :param filename: шлях до вихідного растрового файлу
+    :param extent: межі зображення (xmin, xmax, ymin, ymax)
+    """
+    fig = Figure(figsize=figsize, dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_axes((0, 0, 1, 1))
+    ax.set_xlim(extent[0], extent[1])
+    ax.set_ylim(extent[2], extent[3])
+    ax.set_aspect("equal")
+    ax.axis("off")
+    canvas.draw()  # малюємо тло, після чого лише домальовуємо порції
+
+    for chunk in chunks:
+        collection = PolyCollection(chunk, facecolors="none", edgecolors=color, linewidths=0.5)
+        ax.add_collection(collection, autolim=False)
+        ax.draw_artist(collection)
+        collection.remove()
+
+    imsave(filename, np.asarray(canvas.buffer_rgba()))
+
+def draw_squares_turtle(t, squares):
+    """
+    Малює попередньо обчислені квадрати через turtle.
+    Анімація вимикається, а екран оновлюється один раз після малювання всіх квадратів.
+    """
+    screen = t.getscreen()
+    screen.tracer(0)
+    for corners in squares:
+        t.penup()
+        t.setposition(corners[0])
+        t.pendown()
+        for x, y in corners[1:]:
+            t.goto(x, y)
+        t.goto(corners[0])
+    screen.update()
+
 def main():
+    parser = argparse.ArgumentParser(description="Фрактал 'Дерево Піфагора'")
+    parser.add_argument("--output", help="зберегти зображення у файл (PNG/SVG) без вікна turtle")
+    parser.add_argument("--level", type=int, default=5, help="рівень рекурсії для --output")
+    parser.add_argument("--angle", type=float, default=45, help="кут гілки в градусах для --output")
+    parser.add_argument("--stream", action="store_true",
+                        help="потокова растеризація порціями з обмеженою пам'яттю (лише растрові формати)")
+    parser.add_argument("--min-pixels", type=float, default=0,
+                        help="відкидати гілки, менші за вказану кількість пікселів")
+    args = parser.parse_args()
+
+    # Початкова позиція та параметри
+    initial_size = 100
+    # Розташовуємо дерево так, щоб його нижня частина була внизу екрану;
+    # початкова точка — нижній лівий кут першого квадрата.
+    origin = (-initial_size/2, -250)
+
+    if args.output:
+        # Режим без екрану: обчислюємо геометрію та зберігаємо її у файл
+        # Межі дерева не менші за межі початкового квадрата, тож поріг, обчислений
+        # за ними, не більший за остаточний. Прохід з цим порогом охоплює всі квадрати,
+        # що будуть намальовані, і дає межі, за якими обчислюється остаточний поріг.
+        probe_min_size = args.min_pixels * pixel_size(tree_extent(initial_size, 1, args.angle, origin))
+        extent = tree_extent(initial_size, args.level, args.angle, origin, min_size=probe_min_size)
+        min_size = args.min_pixels * pixel_size(extent)
+        if args.stream:
+            chunks = iter_pythagoras_tree(initial_size, args.level, args.angle, origin, min_size=min_size)
+            render_tree_stream(chunks, args.output, extent)
+        else:
+            squares = pythagoras_tree_geometry(initial_size, args.level, args.angle, origin, min_size=min_size)
+            render_tree(squares, args.output)
+        return
+
     # Налаштування вікна та turtle
     t = turtle.Turtle()
     t.speed(0)         # максимально швидке малювання
@@ -73,19 +312,11 @@ def main():
                                            "Введіть кут гілки (в градусах, наприклад, 45):", 
                                            default=45, minval=0, maxval=90))
 
-    # Початкова позиція та параметри
-    initial_size = 100
-    t.penup()
-    # Розташовуємо дерево так, щоб його нижня частина була внизу екрану;
-    # оскільки функція малює квадрат, початкова точка буде його нижнім лівим кутом.
-    t.setposition(-initial_size/2, -250)
-    t.setheading(0)    # turtle дивиться праворуч
-    t.pendown()
-
-    # Викликаємо рекурсивну функцію для малювання фракталу
-    pythagoras_tree(t, initial_size, recursion_depth, branch_angle)
+    # Обчислюємо всі квадрати заздалегідь і малюємо їх без анімації
+    squares = pythagoras_tree_geometry(initial_size, recursion_depth, branch_angle, origin)
+    draw_squares_turtle(t, squares)
 
     turtle.done()
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()